@@ -1,15 +1,13 @@
+from django.conf import settings
 from django.db import models
-from django.contrib.auth import get_user_model
 import pytz
 
-User = get_user_model()
-
 TIMEZONE_CHOICES = [(tz, tz) for tz in pytz.common_timezones]
 
 
 class UserProfile(models.Model):
     """Extended user profile with email preferences and timezone."""
-    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profile')
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='profile')
     email_product_updates = models.BooleanField(
         default=False,
     )
@@ -291,6 +291,21 @@ class ExportUserDataTests(TestCase):
         self.assertEqual(data['submissions'][0]['survey_name'], 'Test Survey')
         self.assertIn('test_question', data['submissions'][0]['answers'])
 
+    def test_for_dict_serializes_without_extra_queries(self):
+        """Test that responses loaded with for_dict() serialize without further queries."""
+        survey = Survey.objects.create(name='Test Survey', slug='test-survey')
+        question = Question.objects.create(survey=survey, key='test_question', text='Test question?')
+        submission = SurveySubmission.objects.create(survey=survey)
+        Answer.objects.create(submission=submission, question=question, value='Test answer')
+        UserSurveyResponse.objects.create(user=self.user, cohort=self.cohort, submission=submission)
+
+        responses = list(UserSurveyResponse.objects.filter(user=self.user).for_dict())
+
+        with self.assertNumQueries(0):
+            data = responses[0].to_dict()
+        self.assertEqual(data['survey_name'], 'Test Survey')
+        self.assertEqual(data['answers'], {'test_question': 'Test answer'})
+
 
 class DeleteAccountTests(TestCase):
     """Test the account deletion functionality (GDPR compliance)."""
@@ -2,11 +2,11 @@ from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.http import HttpResponse, HttpRequest
 from django.contrib import messages
-import json
 import secrets
 from allauth.account.views import ConfirmLoginCodeView
 from allauth.decorators import rate_limit
 from allauth.account.utils import get_next_redirect_url
+from cohorts import json_utils
 from cohorts.models import UserSurveyResponse, Enrollment
 
 from .forms import UserProfileForm
@@ -85,13 +85,18 @@ def export_user_data(request: HttpRequest) -> HttpResponse:
             'date_joined': user.date_joined.isoformat(),
         },
         'profile': profile.to_dict(),
-        'enrollments': [e.to_dict() for e in Enrollment.objects.filter(user=user)],
-        'submissions': [s.to_dict() for s in UserSurveyResponse.objects.filter(user=user).order_by('submission__completed_at')],
+        'enrollments': [e.to_dict() for e in Enrollment.objects.filter(user=user).for_dict()],
+        'submissions': [
+            s.to_dict()
+            for s in UserSurveyResponse.objects.filter(user=user)
+            .for_dict()
+            .order_by('submission__completed_at')
+        ],
     }
     
     # Return as JSON file
     response = HttpResponse(
-        json.dumps(data, indent=2),
+        json_utils.dumps_bytes(data, indent=2),
         content_type='application/json'
     )
     response['Content-Disposition'] = f'attachment; filename="user_data_{user.id}.json"'
@@ -1,13 +1,11 @@
-import json
-from datetime import datetime
+from datetime import date
 from django.contrib import admin, messages
+from django.db.models import Count
 from django.http import HttpResponse
 from django.shortcuts import redirect
 
-from .models import Cohort, Enrollment, TaskScheduler, UserSurveyResponse
-from django.contrib import admin
-from .models import Cohort, Enrollment, EmailSendLog
-from cohorts.models import TaskScheduler, UserSurveyResponse
+from . import json_utils
+from .models import Cohort, Enrollment, EmailSendLog, TaskScheduler, UserSurveyResponse
 
 
 class TaskSchedulerInline(admin.TabularInline):
@@ -45,9 +43,13 @@ class CohortAdmin(admin.ModelAdmin):
             return []
         return super().get_inlines(request, obj)
 
+    def get_queryset(self, request):
+        """Count enrollments for the changelist in the same query."""
+        return super().get_queryset(request).annotate(enrollment_count=Count('enrollments'))
+
     def seats_display(self, obj):
         """Display seats taken / max seats."""
-        enrolled_count = obj.enrollments.count()
+        enrolled_count = obj.enrollment_count
         if obj.max_seats is None:
             return f"{enrolled_count} / ∞"
         return f"{enrolled_count} / {obj.max_seats}"
@@ -56,7 +58,10 @@ class CohortAdmin(admin.ModelAdmin):
     @admin.action(description='📥 Export selected cohort as JSON')
     def export_cohort_design(self, request, queryset):
         """Export cohort design - downloads immediately."""
-        if queryset.count() > 1:
+        # Fetch at most two rows: enough to detect a multi-selection and
+        # reuse the cohort without a second query.
+        selected = list(queryset[:2])
+        if len(selected) > 1:
             self.message_user(
                 request,
                 "Please select only one cohort to export.",
@@ -64,7 +69,7 @@ class CohortAdmin(admin.ModelAdmin):
             )
             return
         
-        cohort = queryset.first()
+        cohort = selected[0]
         response = HttpResponse(
             cohort.to_json(indent=2),
             content_type='application/json'
@@ -88,8 +93,8 @@ class CohortAdmin(admin.ModelAdmin):
                     raise ValueError("Start date is required")
                 
                 # Parse and create
-                data = json.load(json_file)
-                start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
+                start_date = date.fromisoformat(start_date_str)
+                data = json_utils.loads(json_file.read())
                 
                 cohort = Cohort.from_design_dict(
                     data,
@@ -14,27 +14,34 @@ Supports:
 - Idempotency: tracks sent emails to prevent duplicates via EmailSendLog
 """
 from datetime import date, datetime
-from typing import List
+from functools import lru_cache
+from typing import AbstractSet, Iterable, List, Optional, Tuple
 import pytz
 import logging
 
 from django.core.mail import send_mail
-from django.template.loader import render_to_string
+from django.template.loader import get_template
 from django.template import TemplateDoesNotExist
+from django.template.backends.django import Template
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import Exists, OuterRef, QuerySet
 
 from accounts.models import UserProfile
 from cohorts.tasks import get_user_tasks, PendingTask
-from cohorts.utils import get_user_today
-from cohorts.models import EmailSendLog
+from cohorts.utils import get_timezone, get_user_today
+from cohorts.models import ACTIVE_ENROLLMENT_STATUSES, EmailSendLog, Enrollment
 
 from config.settings.base import *
 
 logger = logging.getLogger(__name__)
 
 
+# Local hour from which reminders are sent
+REMINDER_HOUR = 10
+
+
 def _build_idempotency_key(user_id: int, reminder_date: date) -> str:
     """
     Generate a unique key for a task reminder email.
@@ -44,6 +51,48 @@ def _build_idempotency_key(user_id: int, reminder_date: date) -> str:
     """
     return f"task_reminder:user_{user_id}:{reminder_date.isoformat()}"
 
+def get_timezones_before_reminder_hour(
+    timezone_names: Iterable[str],
+    now: Optional[datetime] = None,
+) -> List[str]:
+    """
+    Return the timezones where it is not yet 10am, computed without touching the DB.
+
+    Args:
+        timezone_names: Timezone strings to check
+        now: Current time (aware); defaults to now
+
+    Returns:
+        The subset of timezone_names whose local hour is before REMINDER_HOUR
+    """
+    now = now or datetime.now(pytz.utc)
+    return [
+        name for name in timezone_names
+        if now.astimezone(get_timezone(name)).hour < REMINDER_HOUR
+    ]
+
+
+def get_reminder_profiles() -> QuerySet[UserProfile]:
+    """
+    Profiles of users who could receive a reminder: they opted in and have
+    at least one active enrollment. The user is selected along with the profile.
+    """
+    has_active_enrollment = Exists(
+        Enrollment.objects.filter(
+            user=OuterRef('user'),
+            cohort__is_active=True,
+            status__in=ACTIVE_ENROLLMENT_STATUSES,
+        )
+    )
+
+    # Get users with ANY email reminders enabled
+    # We'll filter by specific preferences when checking tasks
+    return UserProfile.objects.filter(
+        models.Q(email_daily_reminder=True),
+        has_active_enrollment,
+    ).select_related('user')
+
+
 def send_task_reminders_for_timezone(timezone_name: str, dry_run: bool = False) -> int:
     """
     Send email reminders to users in a specific timezone if it's 10am.
@@ -51,35 +100,55 @@ def send_task_reminders_for_timezone(timezone_name: str, dry_run: bool = False)
     Args:
         timezone_name: Timezone string (e.g., 'America/New_York')
 
+    Returns:
+        Number of emails sent
+    """
+    profiles = get_reminder_profiles().filter(timezone=timezone_name)
+    return send_task_reminders_for_profiles(timezone_name, profiles, dry_run=dry_run)
+
+
+def send_task_reminders_for_profiles(
+    timezone_name: str,
+    profiles: Iterable[UserProfile],
+    dry_run: bool = False,
+) -> int:
+    """
+    Send email reminders to the given profiles if it's 10am in their timezone.
+
+    Args:
+        timezone_name: Timezone string shared by all the profiles
+        profiles: Profiles from get_reminder_profiles() in that timezone. A queryset
+                  is only evaluated once the 10am check has passed.
+
     Returns:
         Number of emails sent
     """
     try:
-        tz = pytz.timezone(timezone_name)
+        tz = get_timezone(timezone_name)
     except pytz.exceptions.UnknownTimeZoneError:
-        logger.error(f"Unknown timezone: {timezone_name}")
+        logger.error("Unknown timezone: %s", timezone_name)
         return 0
 
     current_time = datetime.now(tz)
 
     # Start attempting sends of emails at 10am
-    if current_time.hour < 10:
-        logger.debug(f"Skipping {timezone_name} - current hour is {current_time.hour}, which is before 10am")
+    if current_time.hour < REMINDER_HOUR:
+        logger.debug(
+            "Skipping %s - current hour is %s, which is before 10am", timezone_name, current_time.hour
+        )
         return 0
 
-    logger.info(f"Processing email reminders for timezone: {timezone_name} at {current_time}")
-
-    # Get users in this timezone with ANY email reminders enabled
-    # We'll filter by specific preferences when checking tasks
-    profiles = UserProfile.objects.filter(
-        timezone=timezone_name
-    ).filter(
-        models.Q(email_daily_reminder=True)
-    ).select_related('user')
+    logger.info("Processing email reminders for timezone: %s at %s", timezone_name, current_time)
 
+    profiles = list(profiles)
+    logger.info("Found %d consenting users in timezone: %s", len(profiles), timezone_name)
 
-    logger.info(f"Found {profiles.count()} consenting users in timezone: {timezone_name}")
-    logger.debug(f"Reminder already sent for")
+    # Every profile here shares the same timezone, so they share the same local date.
+    # Fetch the keys already sent for that date in one query instead of one per user.
+    today = current_time.date()
+    sent_keys = EmailSendLog.objects.sent_keys(
+        _build_idempotency_key(profile.user_id, today) for profile in profiles
+    )
 
     emails_sent = 0
 
@@ -87,46 +156,59 @@ def send_task_reminders_for_timezone(timezone_name: str, dry_run: bool = False)
         user = profile.user
 
         try:
-            if send_task_reminder_to_user(user, dry_run=dry_run):
+            if send_task_reminder_to_user(user, dry_run=dry_run, today=today, sent_keys=sent_keys):
                 emails_sent += 1
         except Exception as e:
-            logger.error(f"Error sending reminder to {user.email}: {e}", exc_info=True)
+            logger.error("Error sending reminder to %s: %s", user.email, e, exc_info=True)
             raise  # Let Django Q handle the failure/retry
 
-    logger.info(f"Sent {emails_sent} email reminders for timezone {timezone_name}")
+    logger.info("Sent %d email reminders for timezone %s", emails_sent, timezone_name)
     return emails_sent
 
 
-def send_task_reminder_to_user(user: AbstractUser, dry_run: bool = False) -> bool:
+def send_task_reminder_to_user(
+    user: AbstractUser,
+    dry_run: bool = False,
+    today: Optional[date] = None,
+    sent_keys: Optional[AbstractSet[str]] = None,
+) -> bool:
     """
     Send task reminder email to a single user if they have pending tasks.
 
     Args:
         user: User to send reminder to
         dry_run: If True, log what would be sent without sending or persisting
+        today: The user's local date, if already known (looked up otherwise)
+        sent_keys: Idempotency keys already sent, as pre-fetched by the caller.
+                   If None, the EmailSendLog table is queried for this user.
 
     Returns:
         True if email was sent (or would be sent in dry-run), False otherwise
     """
-    today = get_user_today(user)
+    if today is None:
+        today = get_user_today(user)
 
-    
     # Check idempotency - skip if already sent today
     idempotency_key = _build_idempotency_key(user.id, today)
 
-    if EmailSendLog.objects.was_sent(idempotency_key):
-       logger.debug(f"Reminder already sent for {user.email} on {today}")
+    if sent_keys is not None:
+        already_sent = idempotency_key in sent_keys
+    else:
+        already_sent = EmailSendLog.objects.was_sent(idempotency_key)
+
+    if already_sent:
+       logger.debug("Reminder already sent for %s on %s", user.email, today)
        return False
 
 
-    # Get all active cohorts for user
-    enrollments = user.enrollments.filter(
+    # Get all active cohorts for user (evaluated once, then reused below)
+    enrollments = list(user.enrollments.filter(
         cohort__is_active=True,
-        status__in=['paid', 'free']
-    ).select_related('cohort')
+        status__in=ACTIVE_ENROLLMENT_STATUSES
+    ).select_related('cohort'))
 
-    if not enrollments.exists() or enrollments.count() == 0:
-        logger.debug(f"User {user.email} has no active enrollments")
+    if not enrollments:
+        logger.debug("User %s has no active enrollments", user.email)
         return False
 
     # Collect all pending tasks that need reminders
@@ -134,18 +216,21 @@ def send_task_reminder_to_user(user: AbstractUser, dry_run: bool = False) -> boo
 
     for enrollment in enrollments:
         pending_tasks = get_user_tasks(user, enrollment.cohort, today)
-        logger.info(f"Found {len(pending_tasks)} pending tasks for {user.email} in {enrollment.cohort.name}")
+        logger.info(
+            "Found %d pending tasks for %s in %s",
+            len(pending_tasks), user.email, enrollment.cohort.name,
+        )
         all_pending_tasks.extend(pending_tasks)
 
     if not all_pending_tasks:
-        logger.debug(f"User {user.email} has no pending tasks needing reminders")
+        logger.debug("User %s has no pending tasks needing reminders", user.email)
         return False
 
     # Dry run: log and exit without sending or persisting
     if dry_run:
         logger.info(
-            f"[DRY RUN] Would send reminder to {user.email} "
-            f"with {len(all_pending_tasks)} task(s)"
+            "[DRY RUN] Would send reminder to %s with %d task(s)",
+            user.email, len(all_pending_tasks),
         )
         return True
 
@@ -158,13 +243,45 @@ def send_task_reminder_to_user(user: AbstractUser, dry_run: bool = False) -> boo
            recipient_user=user,
            email_type='task_reminder',
         )
-        logger.info(f"Sent task reminder email to {user.email} with {len(all_pending_tasks)} tasks, with {EMAIL_BACKEND}")
+        logger.info(
+            "Sent task reminder email to %s with %d tasks, with %s",
+            user.email, len(all_pending_tasks), EMAIL_BACKEND,
+        )
         return True
     except Exception as e:
-        logger.error(f"Failed to send email to {user.email}: {e}", exc_info=True)
+        logger.error("Failed to send email to %s: %s", user.email, e, exc_info=True)
         raise  # Let Django Q handle the failure/retry
 
 
+@lru_cache(maxsize=64)
+def _resolve_templates(template_name: str) -> Tuple[Template, Template]:
+    """
+    Resolve the HTML and text templates for an email, falling back to the defaults.
+
+    Template availability does not change while the process runs, so the
+    loaded templates are cached per template_name.
+
+    Args:
+        template_name: Template name without extension (e.g., 'emails/task_reminder')
+
+    Returns:
+        (html_template, text_template)
+    """
+    try:
+        html_template = get_template(f'{template_name}.html')
+    except TemplateDoesNotExist:
+        logger.warning("HTML template %s.html not found, using default", template_name)
+        html_template = get_template('emails/task_reminder.html')
+
+    try:
+        text_template = get_template(f'{template_name}.txt')
+    except TemplateDoesNotExist:
+        logger.warning("Text template %s.txt not found, using default", template_name)
+        text_template = get_template('emails/task_reminder.txt')
+
+    return html_template, text_template
+
+
 def _send_email_with_template(user: AbstractUser, pending_tasks: List[PendingTask], template_name: str) -> None:
     """
     Send email using a specific template.
@@ -180,18 +297,9 @@ def _send_email_with_template(user: AbstractUser, pending_tasks: List[PendingTas
         'site_url': settings.SITE_URL,
     }
 
-    # Try to render custom templates, fall back to default
-    try:
-        html_message = render_to_string(f'{template_name}.html', context)
-    except TemplateDoesNotExist:
-        logger.warning(f"HTML template {template_name}.html not found, using default")
-        html_message = render_to_string('emails/task_reminder.html', context)
-
-    try:
-        plain_message = render_to_string(f'{template_name}.txt', context)
-    except TemplateDoesNotExist:
-        logger.warning(f"Text template {template_name}.txt not found, using default")
-        plain_message = render_to_string('emails/task_reminder.txt', context)
+    html_template, text_template = _resolve_templates(template_name)
+    html_message = html_template.render(context)
+    plain_message = text_template.render(context)
 
     # Generate subject line
     if len(pending_tasks) == 1:
@@ -1,3 +1,4 @@
+from decimal import ROUND_HALF_UP
 from typing import Any, Dict, Optional
 from django import forms
 from django.core.validators import MinValueValidator
@@ -105,7 +106,8 @@ class PaymentAmountForm(forms.Form):
         if amount_dollars is None:
             return cleaned_data
 
-        amount_cents = int(amount_dollars * 100)
+        # Stay in Decimal so whole cents are exact; no float round-trip.
+        amount_cents = int((amount_dollars * 100).to_integral_value(rounding=ROUND_HALF_UP))
 
         if amount_cents < self.minimum_price_cents:
             logger.warning("validation error...")
@@ -0,0 +1,64 @@
+"""
+JSON encode/decode helpers for cohort design import/export.
+
+Uses orjson when it is installed (much faster on the many small dicts that
+make up a cohort design) and falls back to the standard library otherwise.
+Install it with the ``fast-json`` extra.
+
+Both paths produce the same text: non-ASCII characters are written as-is
+rather than escaped, indent=None gives compact output, and indent=2 gives
+2-space indentation. Any other indent (including 0) always goes through the
+standard library, so the output never depends on whether orjson is installed.
+"""
+import json
+from typing import Any, Optional, TextIO, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# orjson only supports compact output or a 2-space indent.
+_ORJSON_INDENT_OPTIONS = {None: 0, 2: orjson.OPT_INDENT_2} if orjson else {}
+
+
+def _stdlib_options(indent: Optional[int]) -> dict:
+    """json.dump(s) keyword arguments that match orjson's output for this indent."""
+    if indent is None:
+        return {'ensure_ascii': False, 'separators': (',', ':')}
+    return {'ensure_ascii': False, 'indent': indent}
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON from bytes or str. Raises json.JSONDecodeError on invalid input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: Optional[int] = 2) -> str:
+    """Encode obj as a JSON string."""
+    if orjson is not None and indent in _ORJSON_INDENT_OPTIONS:
+        return orjson.dumps(obj, option=_ORJSON_INDENT_OPTIONS[indent]).decode()
+    return json.dumps(obj, **_stdlib_options(indent))
+
+
+def dumps_bytes(obj: Any, indent: Optional[int] = 2) -> bytes:
+    """Encode obj as UTF-8 JSON bytes, for writing to binary streams."""
+    if orjson is not None and indent in _ORJSON_INDENT_OPTIONS:
+        return orjson.dumps(obj, option=_ORJSON_INDENT_OPTIONS[indent])
+    return json.dumps(obj, **_stdlib_options(indent)).encode()
+
+
+def dump(obj: Any, fp: TextIO, indent: Optional[int] = 2) -> None:
+    """
+    Encode obj as JSON into an open text file.
+
+    The standard library path writes the document in chunks as it encodes.
+    orjson has no streaming encoder, so with orjson installed the whole
+    document is built in memory and written with a single write() call.
+    """
+    if orjson is not None and indent in _ORJSON_INDENT_OPTIONS:
+        fp.write(dumps(obj, indent=indent))
+    else:
+        json.dump(obj, fp, **_stdlib_options(indent))
@@ -16,6 +16,7 @@ Examples:
     python manage.py export_cohort_design --name "January 2025 Cohort" --output jan2025.json
 """
 from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
 from cohorts.models import Cohort
 
 
@@ -55,38 +56,52 @@ class Command(BaseCommand):
         # Get the cohort
         if cohort_id:
             try:
-                cohort = Cohort.objects.get(pk=cohort_id)
+                cohort = Cohort.objects.with_design().get(pk=cohort_id)
             except Cohort.DoesNotExist:
                 raise CommandError(f"Cohort with ID {cohort_id} does not exist")
         elif cohort_name:
             try:
-                cohort = Cohort.objects.get(name=cohort_name)
+                cohort = Cohort.objects.with_design().get(name=cohort_name)
             except Cohort.DoesNotExist:
                 raise CommandError(f"Cohort with name '{cohort_name}' does not exist")
             except Cohort.MultipleObjectsReturned:
                 raise CommandError(f"Multiple cohorts found with name '{cohort_name}'. Use --cohort_id instead.")
         else:
             # List available cohorts
-            cohorts = Cohort.objects.all()
-            if not cohorts.exists():
+            if not Cohort.objects.exists():
                 raise CommandError("No cohorts found. Create a cohort first.")
             
-            self.stdout.write("\nAvailable cohorts:")
-            for c in cohorts:
-                scheduler_count = c.task_schedulers.count()
-                self.stdout.write(f"  ID {c.pk}: {c.name} ({scheduler_count} surveys scheduled)")
-            self.stdout.write("\nUse: python manage.py export_cohort_design <ID> [--output <file>]")
+            # Only three columns are printed, so skip building model instances.
+            rows = Cohort.objects.annotate(
+                scheduler_count=Count('task_schedulers')
+            ).values_list('pk', 'name', 'scheduler_count')
+
+            lines = ["\nAvailable cohorts:"]
+            lines.extend(
+                f"  ID {pk}: {name} ({scheduler_count} surveys scheduled)"
+                for pk, name, scheduler_count in rows
+            )
+            lines.append("\nUse: python manage.py export_cohort_design <ID> [--output <file>]")
+            self.stdout.write("\n".join(lines))
             return
         
         # Export to JSON
-        json_str = cohort.to_json(indent=indent)
-        
         if output_file:
-            with open(output_file, 'w') as f:
-                f.write(json_str)
+            # Stream into the file; its own buffering coalesces the writes.
+            with open(output_file, 'w', encoding='utf-8') as f:
+                cohort.to_file(f, indent=indent)
             self.stdout.write(
                 self.style.SUCCESS(f"Exported cohort '{cohort.name}' to {output_file}")
             )
         else:
-            self.stdout.write(json_str)
+            # Write the encoded bytes straight to the terminal/pipe in one go,
+            # bypassing OutputWrapper's text handling. Streams without a binary
+            # buffer (e.g. StringIO in call_command) get the text output.
+            buffer = getattr(self.stdout, 'buffer', None)
+            if buffer is not None:
+                self.stdout.flush()
+                buffer.write(cohort.to_json_bytes(indent=indent) + b"\n")
+                buffer.flush()
+            else:
+                self.stdout.write(cohort.to_json(indent=indent))
 
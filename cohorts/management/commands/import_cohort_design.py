@@ -18,9 +18,12 @@ Examples:
     python manage.py import_cohort_design cohort_design.json --validate-only
 """
 import json
-from datetime import datetime
+from datetime import date
+from itertools import islice
+from pathlib import Path
 from django.core.management.base import BaseCommand, CommandError
-from cohorts.models import Cohort
+from cohorts import json_utils
+from cohorts.models import MAX_DESIGN_ERRORS, Cohort
 
 
 class Command(BaseCommand):
@@ -60,21 +63,37 @@ class Command(BaseCommand):
         update_surveys = options.get('update_surveys', False)
         validate_only = options.get('validate_only', False)
         
+        # Check the arguments before reading the file, so a bad invocation fails fast
+        start_date = None
+        if not validate_only:
+            # Parse start date
+            if not start_date_str:
+                raise CommandError("--start-date is required (format: YYYY-MM-DD)")
+            
+            try:
+                start_date = date.fromisoformat(start_date_str)
+            except ValueError:
+                raise CommandError(f"Invalid date format: {start_date_str}. Use YYYY-MM-DD.")
+        
         # Load the JSON file
         try:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
+            data = json_utils.loads(Path(json_file).read_bytes())
         except FileNotFoundError:
             raise CommandError(f"File not found: {json_file}")
         except json.JSONDecodeError as e:
             raise CommandError(f"Invalid JSON in {json_file}: {e}")
         
         # Validate the JSON
-        errors = Cohort.validate_design_dict(data)
+        error_iter = Cohort.iter_design_errors(data)
+        errors = list(islice(error_iter, MAX_DESIGN_ERRORS))
         if errors:
-            self.stdout.write(self.style.ERROR("Validation errors:"))
+            write, error_style = self.stdout.write, self.style.ERROR
+            write(error_style("Validation errors:"))
             for error in errors:
-                self.stdout.write(self.style.ERROR(f"  - {error}"))
+                write(error_style(f"  - {error}"))
+            # Peek for one more error rather than validating the rest of the design
+            if next(error_iter, None) is not None:
+                write(error_style("  ...and more errors"))
             raise CommandError("JSON validation failed")
         
         if validate_only:
@@ -82,15 +101,6 @@ class Command(BaseCommand):
             self._print_summary(data)
             return
         
-        # Parse start date
-        if not start_date_str:
-            raise CommandError("--start-date is required (format: YYYY-MM-DD)")
-        
-        try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
-        except ValueError:
-            raise CommandError(f"Invalid date format: {start_date_str}. Use YYYY-MM-DD.")
-        
         # Import the cohort (validation already done, skip it)
         try:
             cohort = Cohort.from_design_dict(
@@ -103,30 +113,35 @@ class Command(BaseCommand):
         except ValueError as e:
             raise CommandError(str(e))
         
-        self.stdout.write(self.style.SUCCESS(f"\nSuccessfully created cohort:"))
-        self.stdout.write(f"  Name: {cohort.name}")
-        self.stdout.write(f"  ID: {cohort.pk}")
-        self.stdout.write(f"  Start: {cohort.start_date}")
-        self.stdout.write(f"  End: {cohort.end_date}")
-        self.stdout.write(f"  Surveys scheduled: {cohort.task_schedulers.count()}")
-        
-        self.stdout.write(self.style.SUCCESS(f"\nCohort '{cohort.name}' is ready!"))
+        # Build the report and write it once
+        lines = [
+            self.style.SUCCESS(f"\nSuccessfully created cohort:"),
+            f"  Name: {cohort.name}",
+            f"  ID: {cohort.pk}",
+            f"  Start: {cohort.start_date}",
+            f"  End: {cohort.end_date}",
+            f"  Surveys scheduled: {cohort.task_schedulers.count()}",
+            self.style.SUCCESS(f"\nCohort '{cohort.name}' is ready!"),
+        ]
+        self.stdout.write("\n".join(lines))
     
     def _print_summary(self, data):
         """Print a summary of what the JSON contains."""
         template = data.get("cohort_template", {})
         surveys = data.get("surveys", [])
         
-        self.stdout.write(f"\nCohort Template:")
-        self.stdout.write(f"  Name: {template.get('name', '(not specified)')}")
-        self.stdout.write(f"  Duration: {template.get('duration_days', '?')} days")
-        self.stdout.write(f"  Paid: {template.get('is_paid', False)}")
-        
-        self.stdout.write(f"\nSurveys ({len(surveys)}):")
+        lines = [
+            f"\nCohort Template:",
+            f"  Name: {template.get('name', '(not specified)')}",
+            f"  Duration: {template.get('duration_days', '?')} days",
+            f"  Paid: {template.get('is_paid', False)}",
+            f"\nSurveys ({len(surveys)}):",
+        ]
         for survey in surveys:
-            questions = survey.get("questions", [])
-            schedule = survey.get("schedule", {})
-            self.stdout.write(f"  - {survey.get('name', survey.get('slug', '?'))}")
-            self.stdout.write(f"    Questions: {len(questions)}")
-            self.stdout.write(f"    Schedule: {schedule.get('frequency', '?')}")
+            question_count = len(survey.get("questions", []))
+            frequency = survey.get("schedule", {}).get('frequency', '?')
+            lines.append(f"  - {survey.get('name', survey.get('slug', '?'))}")
+            lines.append(f"    Questions: {question_count}")
+            lines.append(f"    Schedule: {frequency}")
+        self.stdout.write("\n".join(lines))
 
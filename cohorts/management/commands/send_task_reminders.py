@@ -9,12 +9,73 @@ Usage:
     
     # Or with verbosity
     python manage.py send_task_reminders --verbosity 2
+
+    # Process several timezones concurrently (only useful with a blocking mail backend)
+    python manage.py send_task_reminders --workers 4
 """
-from typing import Any
-from django.core.management.base import BaseCommand
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from itertools import groupby
+from operator import attrgetter
+from typing import Any, Iterable, Iterator, Optional, Tuple
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from accounts.models import TIMEZONE_CHOICES
+from cohorts.email_reminders import (
+    get_reminder_profiles,
+    get_timezones_before_reminder_hour,
+    send_task_reminders_for_profiles,
+)
+
+DEFAULT_WORKERS = 1
+PROFILE_CHUNK_SIZE = 2000
+
+
+def _send_for_timezone(timezone_name: str, profiles: list, dry_run: bool) -> int:
+    """Worker-thread entry point: send one timezone's reminders, then release the thread's DB connection."""
+    try:
+        return send_task_reminders_for_profiles(timezone_name, profiles, dry_run=dry_run)
+    finally:
+        connections.close_all()
+
+
+def _future_outcome(future: Future) -> Tuple[int, Optional[Exception]]:
+    """Unpack a finished future into (emails_sent, error)."""
+    try:
+        return future.result(), None
+    except Exception as e:
+        return 0, e
 
-from accounts.models import UserProfile
-from cohorts.email_reminders import send_task_reminders_for_timezone
+
+def _iter_timezone_results(
+    groups: Iterable[Tuple[str, list]], dry_run: bool, workers: int
+) -> Iterator[Tuple[str, int, Optional[Exception]]]:
+    """
+    Send each timezone group's reminders and yield (timezone, emails_sent, error)
+    as each one finishes; error is None on success.
+
+    With one worker the groups run inline, in order, on the command's own DB
+    connection. With more, they run on a thread pool that holds at most
+    `workers` groups in memory at a time.
+    """
+    if workers == 1:
+        for tz, profiles in groups:
+            try:
+                yield tz, send_task_reminders_for_profiles(tz, profiles, dry_run=dry_run), None
+            except Exception as e:
+                yield tz, 0, e
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        in_flight = {}
+        for tz, profiles in groups:
+            if len(in_flight) >= workers:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield (in_flight.pop(future), *_future_outcome(future))
+            in_flight[executor.submit(_send_for_timezone, tz, profiles, dry_run)] = tz
+        for future in as_completed(in_flight):
+            yield (in_flight[future], *_future_outcome(future))
 
 
 class Command(BaseCommand):
@@ -31,57 +92,75 @@ class Command(BaseCommand):
             action='store_true',
             help='Show what would be done without sending emails',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=DEFAULT_WORKERS,
+            help=f'Number of timezones processed concurrently (default: {DEFAULT_WORKERS})',
+        )
 
     def handle(self, *args: Any, **options: Any) -> None:
         """Send task reminders to users at 10am their local time."""
         verbosity = options.get('verbosity', 1)
         specific_timezone = options.get('timezone')
         dry_run = options.get('dry_run', False)
+        workers = options.get('workers', DEFAULT_WORKERS)
+        if workers < 1:
+            raise CommandError(f"--workers must be at least 1 (got {workers})")
+        write = self.stdout.write
+        write_error = self.stderr.write
+        style = self.style
         
         if dry_run:
-            self.stdout.write(self.style.WARNING('DRY RUN MODE - No emails will be sent'))
+            write(style.WARNING('DRY RUN MODE - No emails will be sent'))
         
-        # Get all unique timezones from users with reminders enabled
+        # Load every user with reminders enabled in one query, grouped by timezone
+        profiles = get_reminder_profiles().order_by('timezone')
         if specific_timezone:
-            timezones = [specific_timezone]
+            profiles = profiles.filter(timezone=specific_timezone)
             if verbosity >= 1:
-                self.stdout.write(f"Processing specific timezone: {specific_timezone}")
+                write(f"Processing specific timezone: {specific_timezone}")
         else:
-            timezones = UserProfile.objects.values_list('timezone', flat=True).distinct()
-            
-            if verbosity >= 1:
-                self.stdout.write(f"Found {len(timezones)} unique timezones to process")
-        
+            # Timezones where it's not yet 10am have no work; drop them before querying.
+            skipped_timezones = get_timezones_before_reminder_hour(tz for tz, _ in TIMEZONE_CHOICES)
+            profiles = profiles.exclude(timezone__in=skipped_timezones)
+            if verbosity >= 2:
+                write(f"Skipping {len(skipped_timezones)} timezones where it is not yet 10am")
+
+        if not specific_timezone and verbosity >= 1:
+            timezone_count = profiles.order_by().values('timezone').distinct().count()
+            write(f"Found {timezone_count} unique timezones to process")
+
+        # Stream the profiles in chunks instead of loading every row at once.
+        profile_rows = profiles.iterator(chunk_size=PROFILE_CHUNK_SIZE)
+        groups = ((tz, list(group)) for tz, group in groupby(profile_rows, key=attrgetter('timezone')))
         total_emails_sent = 0
-        
-        for tz in timezones:
-            try:
-                # Actually send emails
-                emails_sent = send_task_reminders_for_timezone(tz, dry_run=dry_run)
-                total_emails_sent += emails_sent
-                
-                if emails_sent > 0:
-                    self.stdout.write(
-                        self.style.SUCCESS(f"  ✓ Sent {emails_sent} email(s) for timezone: {tz}")
-                    )
-                elif verbosity >= 2:
-                    self.stdout.write(f"  - No emails sent for timezone: {tz}")
-                    
-            except Exception as e:
-                self.stderr.write(
-                    self.style.ERROR(f"  ✗ Error processing timezone {tz}: {e}")
+
+        for tz, emails_sent, error in _iter_timezone_results(groups, dry_run, workers):
+            if error is not None:
+                write_error(
+                    style.ERROR(f"  ✗ Error processing timezone {tz}: {error}")
+                )
+                continue
+
+            total_emails_sent += emails_sent
+            if emails_sent > 0:
+                write(
+                    style.SUCCESS(f"  ✓ Sent {emails_sent} email(s) for timezone: {tz}")
                 )
+            elif verbosity >= 2:
+                write(f"  - No emails sent for timezone: {tz}")
         
         if dry_run:
-            self.stdout.write(self.style.WARNING('\nDRY RUN COMPLETE - No emails were sent'))
+            write(style.WARNING('\nDRY RUN COMPLETE - No emails were sent'))
         else:
             if total_emails_sent > 0:
-                self.stdout.write(
-                    self.style.SUCCESS(f'\n✓ Successfully sent {total_emails_sent} task reminder email(s)')
+                write(
+                    style.SUCCESS(f'\n✓ Successfully sent {total_emails_sent} task reminder email(s)')
                 )
             else:
                 if verbosity >= 1:
-                    self.stdout.write(
-                        self.style.WARNING('No emails sent')
+                    write(
+                        style.WARNING('No emails sent')
                     )
 
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 17:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cohorts', '0011_cohort_onboarding_survey'),
+        ('surveys', '0010_remove_survey_purpose_alter_question_question_type'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cohort',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['enrollment_start_date', 'enrollment_end_date'], name='cohort_joinable_idx'),
+        ),
+    ]
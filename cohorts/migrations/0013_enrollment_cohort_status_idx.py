@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 17:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cohorts', '0012_cohort_joinable_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['cohort', 'status'], name='enrollment_cohort_status_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-16 17:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cohorts', '0013_enrollment_cohort_status_idx'),
+        ('surveys', '0010_remove_survey_purpose_alter_question_question_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usersurveyresponse',
+            index=models.Index(fields=['user', 'cohort'], name='response_user_cohort_idx'),
+        ),
+    ]
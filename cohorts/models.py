@@ -1,29 +1,75 @@
 from __future__ import annotations
-import json
+import logging
 from datetime import date, timedelta
-from typing import TYPE_CHECKING, Optional
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, TextIO
 
+from django.conf import settings
 from django.db import models, transaction
-from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator, MaxValueValidator
-from django.db.models import Q
+from django.db.models import Count, F, Prefetch, Q
 from django.utils import timezone
+from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
-from surveys.models import SurveySubmission, Survey
+from surveys.models import Answer, Question, SurveySubmission, Survey
+
+from . import json_utils
 
 if TYPE_CHECKING:
     from typing import Self
 
-User = get_user_model()
+logger = logging.getLogger(__name__)
+
+# Enrollment statuses that take up a seat
+ACTIVE_ENROLLMENT_STATUSES = ('paid', 'free')
+
+# Validation stops after this many errors; the first few are enough to fix a design.
+MAX_DESIGN_ERRORS = 10
+
+# Cohorts without an explicit enrollment period can be joined at any time.
+# Combining a Q with | builds a new node, so this one is safe to share.
+_NO_ENROLLMENT_PERIOD = Q(enrollment_start_date__isnull=True, enrollment_end_date__isnull=True)
+
+class CohortQuerySet(models.QuerySet):
+    def with_seat_stats(self):
+        """
+        Annotates each cohort with active_enrollment_count, so seats_available()
+        and is_full() need no query per cohort.
+        """
+        return self.annotate(
+            active_enrollment_count=Count(
+                'enrollments', filter=Q(enrollments__status__in=ACTIVE_ENROLLMENT_STATUSES)
+            ),
+        )
 
-class CohortManager(models.Manager):
-    def get_joinable(self):
+    def with_design(self):
         """
-        Returns active, non-full cohorts that are within their joining period.
+        Returns cohorts with the survey/schedule graph used by to_design_dict()
+        prefetched, so exporting any number of designs takes a fixed number of queries.
+        """
+        return self.prefetch_related(
+            Prefetch(
+                'task_schedulers',
+                queryset=TaskScheduler.objects.select_related('survey').prefetch_related('survey__questions'),
+            )
+        )
+
+
+class CohortManager(models.Manager.from_queryset(CohortQuerySet)):
+    def get_joinable(self, today: Optional[date] = None):
+        """
+        Returns active, non-full cohorts that are within their joining period,
+        annotated with active_enrollment_count.
         This mirrors the logic in the Cohort.can_join() method.
+
+        Args:
+            today: The date to check enrollment periods against, if the caller
+                   already has it (defaults to the current date)
         """
-        today = timezone.now().date()
+        if today is None:
+            today = timezone.localdate()
 
         # A cohort is joinable if it's within an explicit enrollment period...
         within_enrollment_period = Q(
@@ -31,19 +77,16 @@ class CohortManager(models.Manager):
             enrollment_end_date__gte=today
         )
         # ...or if no specific enrollment period is defined.
-        no_enrollment_period = Q(
-            enrollment_start_date__isnull=True,
-            enrollment_end_date__isnull=True
-        )
-
         joinable_cohorts = self.filter(
-            Q(within_enrollment_period | no_enrollment_period),
+            within_enrollment_period | _NO_ENROLLMENT_PERIOD,
             is_active=True,
-        )
+        ).with_seat_stats()
 
-        # Exclude full cohorts in Python, as this is simpler than a complex subquery.
-        cohorts_with_seats = [c for c in joinable_cohorts if not c.is_full()]
-        return cohorts_with_seats
+        # Exclude full cohorts in the same query, rather than counting each cohort's seats.
+        # The join/landing pages never read the audit timestamps, so skip loading them.
+        return joinable_cohorts.filter(
+            Q(max_seats__isnull=True) | Q(active_enrollment_count__lt=F('max_seats'))
+        ).defer('created_at', 'updated_at')
 
 
 class Cohort(models.Model):
@@ -92,6 +135,14 @@ class Cohort(models.Model):
 
     class Meta:
         ordering = ['-start_date']
+        indexes = [
+            # Serves the enrollment-window filter in CohortManager.get_joinable()
+            models.Index(
+                fields=['enrollment_start_date', 'enrollment_end_date'],
+                condition=Q(is_active=True),
+                name='cohort_joinable_idx',
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.name} ({self.start_date} to {self.end_date})"
@@ -101,8 +152,11 @@ class Cohort(models.Model):
         return self.enrollments.filter(status='pending').count()
     
     def active_enrollments(self) -> int:
-        """Count of active enrollments."""
-        return self.enrollments.filter(status__in=['paid', 'free']).count()
+        """Count of active enrollments, from the with_seat_stats() annotation when present."""
+        annotated = getattr(self, 'active_enrollment_count', None)
+        if annotated is not None:
+            return annotated
+        return self.enrollments.filter(status__in=ACTIVE_ENROLLMENT_STATUSES).count()
 
     def seats_available(self) -> Optional[int]:
         """Return remaining seats or None if unlimited."""
@@ -113,10 +167,17 @@ class Cohort(models.Model):
 
     def is_full(self) -> bool:
         """Check if cohort has reached seat capacity."""
-        seats_available = self.seats_available()
-        if seats_available is None:
+        if self.max_seats is None:
             return False
-        return seats_available <= 0
+        if self.max_seats < 1:
+            return True
+        if getattr(self, 'active_enrollment_count', None) is not None:
+            return self.seats_available() <= 0
+        # Full means a max_seats-th active enrollment exists; probing for that one
+        # row lets the database stop there instead of counting every enrollment.
+        return self.enrollments.filter(
+            status__in=ACTIVE_ENROLLMENT_STATUSES
+        ).order_by()[self.max_seats - 1:self.max_seats].exists()
 
     def to_design_dict(self) -> dict:
         """
@@ -133,17 +194,41 @@ class Cohort(models.Model):
                 "max_seats": self.max_seats,
             },
             "surveys": [
-                {
-                    **scheduler.survey.to_design_dict(),
-                    "schedule": scheduler.to_design_dict(),
-                }
-                for scheduler in self.task_schedulers.select_related('survey').prefetch_related('survey__questions')
+                self._survey_design_dict(scheduler)
+                for scheduler in self._design_schedulers()
             ]
         }
 
+    @staticmethod
+    def _survey_design_dict(scheduler: TaskScheduler) -> dict:
+        """A survey's design dict with its schedule added."""
+        # to_design_dict() returns a fresh dict, so extend it in place rather than copying it.
+        data = scheduler.survey.to_design_dict()
+        data["schedule"] = scheduler.to_design_dict()
+        return data
+
+    def _design_schedulers(self):
+        """Task schedulers for the design export, reusing a with_design() prefetch if present."""
+        if 'task_schedulers' in getattr(self, '_prefetched_objects_cache', {}):
+            return self.task_schedulers.all()
+        return self.task_schedulers.select_related('survey').prefetch_related('survey__questions')
+
     def to_json(self, indent: int = 2) -> str:
         """Export cohort design to a formatted JSON string."""
-        return json.dumps(self.to_design_dict(), indent=indent)
+        return json_utils.dumps(self.to_design_dict(), indent=indent)
+
+    def to_json_bytes(self, indent: int = 2) -> bytes:
+        """Export cohort design as UTF-8 JSON bytes, for binary streams."""
+        return json_utils.dumps_bytes(self.to_design_dict(), indent=indent)
+
+    def to_file(self, fp: TextIO, indent: int = 2) -> None:
+        """
+        Write the cohort design as JSON to an open text file.
+
+        Without orjson the JSON is written in chunks as it is encoded. With
+        orjson the full document is buffered in memory first (see json_utils.dump).
+        """
+        json_utils.dump(self.to_design_dict(), fp, indent=indent)
 
     @classmethod
     def validate_design_dict(cls, data: dict) -> list[str]:
@@ -151,64 +236,66 @@ class Cohort(models.Model):
         Validate a cohort design dict structure.
         Returns a list of error messages (empty list if valid).
         """
-        errors = []
-        
+        return list(cls.iter_design_errors(data))
+
+    @classmethod
+    def iter_design_errors(cls, data: dict) -> Iterator[str]:
+        """
+        Yield the error messages for a cohort design dict, in order.
+        Callers that only need the first few errors can stop early.
+        """
         # Check top-level structure
         if "cohort_template" not in data:
-            errors.append("Missing 'cohort_template' key")
+            yield "Missing 'cohort_template' key"
         else:
             template = data["cohort_template"]
             if "duration_days" not in template:
-                errors.append("cohort_template missing 'duration_days'")
+                yield "cohort_template missing 'duration_days'"
             if "name" not in template:
-                errors.append("cohort_template missing 'name'")
+                yield "cohort_template missing 'name'"
         
         if "surveys" not in data:
-            errors.append("Missing 'surveys' key")
+            yield "Missing 'surveys' key"
         elif not isinstance(data["surveys"], list):
-            errors.append("'surveys' must be a list")
+            yield "'surveys' must be a list"
         else:
+            # Error paths are formatted only when yielded, so a valid design builds no strings.
             for i, survey in enumerate(data["surveys"]):
-                prefix = f"surveys[{i}]"
-                
                 if "slug" not in survey and "name" not in survey:
-                    errors.append(f"{prefix}: must have 'slug' or 'name'")
+                    yield f"surveys[{i}]: must have 'slug' or 'name'"
                 
                 if "questions" not in survey:
-                    errors.append(f"{prefix}: missing 'questions'")
+                    yield f"surveys[{i}]: missing 'questions'"
                 elif not isinstance(survey["questions"], list):
-                    errors.append(f"{prefix}: 'questions' must be a list")
+                    yield f"surveys[{i}]: 'questions' must be a list"
                 else:
                     for j, q in enumerate(survey["questions"]):
-                        q_prefix = f"{prefix}.questions[{j}]"
                         if "key" not in q:
-                            errors.append(f"{q_prefix}: missing 'key'")
+                            yield f"surveys[{i}].questions[{j}]: missing 'key'"
                         if "text" not in q:
-                            errors.append(f"{q_prefix}: missing 'text'")
+                            yield f"surveys[{i}].questions[{j}]: missing 'text'"
                         if "type" not in q:
-                            errors.append(f"{q_prefix}: missing 'type'")
-                        elif q["type"] not in ["text", "textarea", "integer", "decimal", "radio", "info"]:
-                            errors.append(f"{q_prefix}: invalid type '{q['type']}'")
+                            yield f"surveys[{i}].questions[{j}]: missing 'type'"
+                        elif not _is_design_choice(q["type"], _DESIGN_QUESTION_TYPES):
+                            yield f"surveys[{i}].questions[{j}]: invalid type '{q['type']}'"
                 
                 if "schedule" not in survey:
-                    errors.append(f"{prefix}: missing 'schedule'")
+                    yield f"surveys[{i}]: missing 'schedule'"
                 else:
                     schedule = survey["schedule"]
                     if "frequency" not in schedule:
-                        errors.append(f"{prefix}.schedule: missing 'frequency'")
-                    elif schedule["frequency"] not in ["ONCE", "DAILY", "WEEKLY"]:
-                        errors.append(f"{prefix}.schedule: invalid frequency '{schedule['frequency']}'")
+                        yield f"surveys[{i}].schedule: missing 'frequency'"
+                    elif not _is_design_choice(schedule["frequency"], _DESIGN_FREQUENCIES):
+                        yield f"surveys[{i}].schedule: invalid frequency '{schedule['frequency']}'"
                     elif schedule["frequency"] == "WEEKLY" and "day_of_week" not in schedule:
-                        errors.append(f"{prefix}.schedule: WEEKLY frequency requires 'day_of_week'")
+                        yield f"surveys[{i}].schedule: WEEKLY frequency requires 'day_of_week'"
                     elif schedule["frequency"] == "ONCE":
                         if "offset_days" not in schedule:
-                            errors.append(f"{prefix}.schedule: ONCE frequency requires 'offset_days'")
+                            yield f"surveys[{i}].schedule: ONCE frequency requires 'offset_days'"
                         if "offset_from" not in schedule:
-                            errors.append(f"{prefix}.schedule: ONCE frequency requires 'offset_from'")
-                        elif schedule["offset_from"] not in TaskScheduler.OffsetFrom.values:
-                            errors.append(f"{prefix}.schedule: invalid offset_from '{schedule['offset_from']}'")
-        
-        return errors
+                            yield f"surveys[{i}].schedule: ONCE frequency requires 'offset_from'"
+                        elif not _is_design_choice(schedule["offset_from"], _DESIGN_OFFSET_FROMS):
+                            yield f"surveys[{i}].schedule: invalid offset_from '{schedule['offset_from']}'"
 
     @classmethod
     def from_json_file(cls, file_path: str, start_date: date, **kwargs) -> Self:
@@ -220,8 +307,7 @@ class Cohort(models.Model):
             start_date: The start date for this cohort instance
             **kwargs: Additional arguments passed to from_design_dict()
         """
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        data = json_utils.loads(Path(file_path).read_bytes())
         return cls.from_design_dict(data, start_date, **kwargs)
 
     @classmethod
@@ -252,7 +338,7 @@ class Cohort(models.Model):
             ValueError: If validate=True and the dict structure is invalid.
         """
         if validate:
-            errors = cls.validate_design_dict(data)
+            errors = list(islice(cls.iter_design_errors(data), MAX_DESIGN_ERRORS))
             if errors:
                 raise ValueError(f"Invalid cohort design: {'; '.join(errors)}")
         
@@ -271,51 +357,53 @@ class Cohort(models.Model):
             is_active=True,
         )
         
-        # Create or get surveys and their schedules
-        # Note: A post_save signal may create default schedulers, so we use get_or_create
-        # and update with the imported schedule settings
-        for survey_data in data.get("surveys", []):
-            survey = cls._get_or_create_survey(survey_data, update_existing=update_existing_surveys)
-            schedule_data = survey_data.get("schedule", {})
-            
-            # Get existing scheduler (possibly created by signal) or create new one
-            scheduler, created = TaskScheduler.objects.get_or_create(
-                cohort=cohort,
-                survey=survey,
-                defaults={
-                    "frequency": schedule_data["frequency"],
-                    "is_cumulative": schedule_data.get("is_cumulative", False),
-                    "task_title_template": schedule_data.get("task_title_template", ""),
-                    "task_description_template": schedule_data.get("task_description_template", ""),
-                    "day_of_week": schedule_data.get("day_of_week"),
-                    "offset_days": schedule_data.get("offset_days"),
-                    "offset_from": schedule_data.get("offset_from"),
-                }
+        # Create or get surveys, then create all their schedules in one query.
+        # The cohort is new, so it has no schedulers yet. Keyed by survey so a
+        # repeated slug keeps the last schedule, as (cohort, survey) is unique.
+        surveys_data = data.get("surveys", [])
+        # Look up every existing survey in one query instead of one per survey.
+        slugs = [cls._design_survey_slug(survey_data) for survey_data in surveys_data]
+        surveys_by_slug = Survey.objects.in_bulk(slugs, field_name='slug')
+        schedulers = {}
+        updated_surveys = {}
+        for survey_data, slug in zip(surveys_data, slugs, strict=True):
+            existing = surveys_by_slug.get(slug)
+            survey = cls._get_or_create_survey(
+                survey_data, slug, existing, update_existing=update_existing_surveys
+            )
+            if existing is not None and update_existing_surveys:
+                updated_surveys[survey.pk] = (survey, survey_data)
+            surveys_by_slug[slug] = survey
+            schedulers[survey.pk] = TaskScheduler.from_design_dict(
+                cohort, survey, survey_data.get("schedule", {})
             )
-            
-            # If it already existed (from signal), update it with imported settings
-            if not created:
-                scheduler.frequency = schedule_data["frequency"]
-                scheduler.is_cumulative = schedule_data.get("is_cumulative", False)
-                scheduler.task_title_template = schedule_data.get("task_title_template", "")
-                scheduler.task_description_template = schedule_data.get("task_description_template", "")
-                scheduler.day_of_week = schedule_data.get("day_of_week")
-                scheduler.offset_days = schedule_data.get("offset_days")
-                scheduler.offset_from = schedule_data.get("offset_from")
-                scheduler.save()
+        if updated_surveys:
+            cls._save_updated_surveys(list(updated_surveys.values()))
+        TaskScheduler.objects.bulk_create(schedulers.values())
         
         return cohort
 
     @staticmethod
-    def _get_or_create_survey(survey_data: dict, update_existing: bool = False) -> Survey:
-        """Helper to get or create a survey from design data."""
-        from django.utils.text import slugify
-        from surveys.models import Question
-        
-        slug = survey_data.get("slug") or slugify(survey_data["name"])
-        
-        # Check if survey already exists
-        existing = Survey.objects.filter(slug=slug).first()
+    def _design_survey_slug(survey_data: dict) -> str:
+        """The slug a survey in design data is stored under."""
+        return survey_data.get("slug") or slugify(survey_data["name"])
+
+    @staticmethod
+    def _get_or_create_survey(
+        survey_data: dict, slug: str, existing: Optional[Survey], update_existing: bool = False
+    ) -> Survey:
+        """
+        Helper to get or create a survey from design data.
+
+        An updated survey is only changed in memory; the caller writes it
+        (and replaces its questions) with _save_updated_surveys().
+
+        Args:
+            survey_data: The survey design dict
+            slug: The survey's slug, from _design_survey_slug()
+            existing: The survey already stored under this slug, if any
+            update_existing: If True, overwrite an existing survey and its questions
+        """
         if existing and not update_existing:
             return existing
         
@@ -324,16 +412,36 @@ class Cohort(models.Model):
             existing.name = survey_data.get("name", slug)
             existing.description = survey_data.get("description", "")
             existing.title_template = survey_data.get("title_template", "{survey_name}")
-            existing.save()
-            # Delete and recreate questions
-            existing.questions.all().delete()
-            for i, q_data in enumerate(survey_data.get("questions", [])):
-                Question.from_design_dict(existing, q_data, order=i).save()
             return existing
         
         # Create new survey with questions
         return Survey.from_design_dict(survey_data, save=True)
 
+    @staticmethod
+    def _save_updated_surveys(updates: list[tuple[Survey, dict]]) -> None:
+        """
+        Save surveys updated by _get_or_create_survey() and recreate their questions,
+        in a fixed number of queries however many surveys changed.
+
+        Args:
+            updates: (survey, survey design dict) pairs
+        """
+        surveys = [survey for survey, _ in updates]
+        Survey.objects.bulk_update(surveys, ['name', 'description', 'title_template'])
+        # Delete and recreate questions
+        Question.objects.filter(survey__in=surveys).delete()
+        Question.objects.bulk_create([
+            Question.from_design_dict(survey, q_data, order=i)
+            for survey, survey_data in updates
+            for i, q_data in enumerate(survey_data.get("questions", []))
+        ])
+
+
+class EnrollmentQuerySet(models.QuerySet):
+    def for_dict(self):
+        """Returns enrollments with the cohort to_dict() reads joined in."""
+        return self.select_related('cohort')
+
 
 class Enrollment(models.Model):
     """User enrollment in a cohort."""
@@ -344,7 +452,7 @@ class Enrollment(models.Model):
         ('refunded', 'Refunded'),
     ]
     
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='enrollments')
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='enrollments')
     cohort = models.ForeignKey(Cohort, on_delete=models.CASCADE, related_name='enrollments')
     status = models.CharField(
         max_length=20,
@@ -364,9 +472,15 @@ class Enrollment(models.Model):
     )
     enrolled_at = models.DateTimeField(auto_now_add=True)
 
+    objects = EnrollmentQuerySet.as_manager()
+
     class Meta:
         unique_together = ['user', 'cohort']
         ordering = ['-enrolled_at']
+        indexes = [
+            # Serves the per-cohort status counts (seat checks in get_joinable, is_full)
+            models.Index(fields=['cohort', 'status'], name='enrollment_cohort_status_idx'),
+        ]
 
     def __str__(self) -> str:
         return f"{self.user.email} - {self.cohort.name} ({self.status})"
@@ -378,7 +492,6 @@ class Enrollment(models.Model):
             'status': self.status,
             'amount_paid_cents': self.amount_paid_cents,
             'paid_at': self.paid_at.isoformat() if self.paid_at else None,
-            'enrolled_at': self.enrolled_at.isoformat(),
         }
     
 
@@ -430,9 +543,9 @@ class TaskScheduler(models.Model):
             "task_description_template": self.task_description_template,
         }
         # Add frequency-specific fields
-        if self.frequency == self.Frequency.WEEKLY:
+        if self.frequency == _FREQUENCY_WEEKLY:
             data["day_of_week"] = self.day_of_week
-        elif self.frequency == self.Frequency.ONCE:
+        elif self.frequency == _FREQUENCY_ONCE:
             data["offset_days"] = self.offset_days
             data["offset_from"] = self.offset_from
         return data
@@ -453,26 +566,68 @@ class TaskScheduler(models.Model):
         )
 
 
+# Allowed values for Cohort.validate_design_dict, built once from the model choices
+# instead of per question/schedule.
+_DESIGN_QUESTION_TYPES = frozenset(Question.QuestionType.values)
+_DESIGN_FREQUENCIES = frozenset(TaskScheduler.Frequency.values)
+_DESIGN_OFFSET_FROMS = frozenset(TaskScheduler.OffsetFrom.values)
+
+
+def _is_design_choice(value, choices: frozenset) -> bool:
+    """
+    True if value is one of the allowed strings. Non-string JSON values (lists,
+    dicts) are unhashable, so they are rejected before the set lookup.
+    """
+    return isinstance(value, str) and value in choices
+
+# Plain-str frequency values for TaskScheduler.to_design_dict, compared without enum lookups.
+_FREQUENCY_WEEKLY = TaskScheduler.Frequency.WEEKLY.value
+_FREQUENCY_ONCE = TaskScheduler.Frequency.ONCE.value
+
+
+class UserSurveyResponseQuerySet(models.QuerySet):
+    def for_dict(self):
+        """
+        Returns responses with everything to_dict() reads loaded up front,
+        so serializing many responses takes a fixed number of queries.
+        """
+        return self.select_related('cohort', 'submission__survey').prefetch_related(
+            Prefetch('submission__answers', queryset=Answer.objects.select_related('question'))
+        )
+
+
 class UserSurveyResponse(models.Model):
     """A user's submission for a specific survey."""
     submission = models.ForeignKey(SurveySubmission, on_delete=models.CASCADE, related_name='user_responses')
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='survey_submissions')
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='survey_submissions')
     cohort = models.ForeignKey(Cohort, on_delete=models.CASCADE, related_name='survey_submissions')
     due_date = models.DateField(null=True, blank=True, help_text="The specific due date of the task this submission fulfills.")
 
+    objects = UserSurveyResponseQuerySet.as_manager()
+
     class Meta:
         ordering = ['-submission__completed_at']
+        indexes = [
+            # Task lists, survey views and onboarding all look up a user's responses within a cohort
+            models.Index(fields=['user', 'cohort'], name='response_user_cohort_idx'),
+        ]
 
     def __str__(self) -> str:
         return f"Submission for {self.submission.survey.name} by {self.user.email} on {self.submission.completed_at.strftime('%Y-%m-%d')}"
 
     def to_dict(self):
-        answers = {ans.question.key: ans.value for ans in self.submission.answers.all()}
+        submission = self.submission
+        if 'answers' in getattr(submission, '_prefetched_objects_cache', {}):
+            # Loaded by for_dict()
+            answers = {ans.question.key: ans.value for ans in submission.answers.all()}
+        else:
+            # Fetch key/value pairs in one joined query rather than a question lookup per answer.
+            answers = dict(submission.answers.values_list('question__key', 'value'))
 
         data = {
             'cohort': self.cohort.name,
-            'survey_name': self.submission.survey.name,
-            'completed_at': self.submission.completed_at.isoformat(),
+            'survey_name': submission.survey.name,
+            'completed_at': submission.completed_at.isoformat(),
             'answers': answers,
         }
         if self.due_date:
@@ -487,6 +642,13 @@ class EmailSendLogManager(models.Manager):
         """Check if an email with this key was successfully sent."""
         return self.filter(idempotency_key=idempotency_key).exists()
 
+    def sent_keys(self, idempotency_keys: Iterable[str]) -> set[str]:
+        """Return the subset of idempotency_keys already sent, in one query."""
+        return set(
+            self.filter(idempotency_key__in=list(idempotency_keys))
+            .values_list('idempotency_key', flat=True)
+        )
+
     def record_sent(
         self,
         idempotency_key: str,
@@ -494,13 +656,23 @@ class EmailSendLogManager(models.Manager):
         email_type: str,
         recipient_user=None,
     ):
-        """Record a successfully sent email."""
-        return self.create(
+        """
+        Record a successfully sent email.
+
+        Recording the same key twice returns the existing log instead of raising;
+        get_or_create also handles a concurrent insert of the same key.
+        """
+        log, created = self.get_or_create(
             idempotency_key=idempotency_key,
-            recipient_email=recipient_email,
-            recipient_user=recipient_user,
-            email_type=email_type,
+            defaults={
+                'recipient_email': recipient_email,
+                'recipient_user': recipient_user,
+                'email_type': email_type,
+            },
         )
+        if not created:
+            logger.warning("Email already recorded as sent: %s", idempotency_key)
+        return log
 
 
 class EmailSendLog(models.Model):
@@ -509,7 +681,7 @@ class EmailSendLog(models.Model):
     idempotency_key = models.CharField(max_length=255, unique=True)
     recipient_email = models.EmailField()
     recipient_user = models.ForeignKey(
-        User,
+        settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
         null=True,
         blank=True,
@@ -38,10 +38,12 @@ def create_survey_submission(
             due_date=due_date
         )
         
-        # Create an Answer for each question in the form
-        for question in survey.questions.all():
-            answer_value = form.cleaned_data.get(question.key)
-            if answer_value is not None:
-                Answer.objects.create(submission=submission, question=question, value=str(answer_value))
-                
+        # Create an Answer for each answered question in a single INSERT
+        cleaned_data = form.cleaned_data
+        Answer.objects.bulk_create([
+            Answer(submission=submission, question=question, value=str(cleaned_data[question.key]))
+            for question in form.questions
+            if cleaned_data.get(question.key) is not None
+        ])
+
     return submission
\ No newline at end of file
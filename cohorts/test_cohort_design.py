@@ -0,0 +1,231 @@
+"""
+Tests for cohort design import/export.
+
+Tests cover:
+- Importing a design dict (cohort, surveys, questions, schedules)
+- Reusing vs. updating existing surveys
+- Exporting a cohort back to a design dict
+- Design dict validation
+"""
+from datetime import date
+from pathlib import Path
+from unittest import mock, skipIf
+
+from django.conf import settings
+from django.test import TestCase
+
+from cohorts import json_utils
+from cohorts.models import Cohort, TaskScheduler
+from surveys.models import Question, Survey
+
+DESIGN_FILE = Path(settings.BASE_DIR) / 'cohort_designs' / '30day_digital_decluttter.json'
+
+
+def _minimal_design(**template_overrides):
+    """A small, valid design dict with one daily and one weekly survey."""
+    return {
+        "cohort_template": {"name": "Test Design", "duration_days": 30, **template_overrides},
+        "surveys": [
+            {
+                "slug": "daily",
+                "name": "Daily",
+                "questions": [
+                    {"key": "mood", "text": "How are you?", "type": "integer"},
+                    {"key": "notes", "text": "Anything else?", "type": "textarea"},
+                ],
+                "schedule": {"frequency": "DAILY"},
+            },
+            {
+                "slug": "weekly",
+                "name": "Weekly",
+                "questions": [
+                    {"key": "goal", "text": "Your goal", "type": "text"},
+                ],
+                "schedule": {"frequency": "WEEKLY", "day_of_week": 6},
+            },
+        ],
+    }
+
+
+class CohortDesignImportTests(TestCase):
+    """Tests for Cohort.from_design_dict."""
+
+    def test_import_creates_cohort_surveys_and_schedules(self):
+        """Test that importing a design creates everything it describes."""
+        cohort = Cohort.from_design_dict(_minimal_design(), start_date=date(2025, 1, 1))
+
+        self.assertEqual(cohort.name, 'Test Design')
+        self.assertEqual(cohort.end_date, date(2025, 1, 31))
+        self.assertEqual(cohort.task_schedulers.count(), 2)
+        self.assertEqual(
+            list(Question.objects.filter(survey__slug='daily').values_list('key', 'order')),
+            [('mood', 0), ('notes', 1)],
+        )
+        weekly = TaskScheduler.objects.get(cohort=cohort, survey__slug='weekly')
+        self.assertEqual(weekly.day_of_week, 6)
+
+    def test_import_reuses_existing_survey_by_default(self):
+        """Test that an existing survey with the same slug is reused as-is."""
+        Survey.objects.create(slug='daily', name='Original Daily')
+
+        Cohort.from_design_dict(_minimal_design(), start_date=date(2025, 1, 1))
+
+        survey = Survey.objects.get(slug='daily')
+        self.assertEqual(survey.name, 'Original Daily')
+        self.assertEqual(survey.questions.count(), 0)
+
+    def test_import_updates_existing_survey_when_requested(self):
+        """Test that update_existing_surveys replaces the survey's questions."""
+        survey = Survey.objects.create(slug='daily', name='Original Daily')
+        Question.objects.create(survey=survey, key='old', text='Old question')
+
+        Cohort.from_design_dict(
+            _minimal_design(), start_date=date(2025, 1, 1), update_existing_surveys=True
+        )
+
+        survey.refresh_from_db()
+        self.assertEqual(survey.name, 'Daily')
+        self.assertEqual(list(survey.questions.values_list('key', flat=True)), ['mood', 'notes'])
+
+    def test_update_replaces_questions_of_every_existing_survey(self):
+        """Test that updating several existing surveys rewrites each one's questions."""
+        for slug in ('daily', 'weekly'):
+            survey = Survey.objects.create(slug=slug, name=slug.title())
+            Question.objects.create(survey=survey, key='old', text='Old question')
+
+        Cohort.from_design_dict(
+            _minimal_design(), start_date=date(2025, 1, 1), update_existing_surveys=True
+        )
+
+        self.assertEqual(
+            sorted(Question.objects.values_list('survey__slug', 'key')),
+            [('daily', 'mood'), ('daily', 'notes'), ('weekly', 'goal')],
+        )
+
+    def test_invalid_design_raises_value_error(self):
+        """Test that an invalid design is rejected before anything is created."""
+        with self.assertRaises(ValueError):
+            Cohort.from_design_dict({"surveys": []}, start_date=date(2025, 1, 1))
+
+        self.assertFalse(Cohort.objects.exists())
+
+
+class CohortDesignExportTests(TestCase):
+    """Tests for Cohort.to_design_dict and the JSON helpers."""
+
+    def test_bundled_design_round_trips(self):
+        """Test that exporting an imported design gives back the same surveys."""
+        data = json_utils.loads(DESIGN_FILE.read_bytes())
+        cohort = Cohort.from_design_dict(data, start_date=date(2025, 1, 1))
+
+        exported = cohort.to_design_dict()
+
+        self.assertEqual(exported["cohort_template"], data["cohort_template"])
+        by_slug = {survey["slug"]: survey for survey in exported["surveys"]}
+        self.assertEqual(set(by_slug), {survey["slug"] for survey in data["surveys"]})
+        for survey in data["surveys"]:
+            exported_survey = by_slug[survey["slug"]]
+            self.assertEqual(
+                [q["key"] for q in exported_survey["questions"]],
+                [q["key"] for q in survey["questions"]],
+            )
+            self.assertEqual(exported_survey["schedule"]["frequency"], survey["schedule"]["frequency"])
+
+    def test_with_design_exports_many_cohorts_in_fixed_queries(self):
+        """Test that with_design() on a queryset prefetches every cohort's design."""
+        for start in (date(2025, 1, 1), date(2025, 2, 1)):
+            Cohort.from_design_dict(_minimal_design(), start_date=start)
+
+        with self.assertNumQueries(3):
+            designs = [cohort.to_design_dict() for cohort in Cohort.objects.filter(is_active=True).with_design()]
+
+        self.assertEqual(len(designs), 2)
+        self.assertEqual([len(design["surveys"]) for design in designs], [2, 2])
+
+    def test_to_json_matches_design_dict(self):
+        """Test that to_json serializes to_design_dict."""
+        cohort = Cohort.from_design_dict(_minimal_design(), start_date=date(2025, 1, 1))
+
+        self.assertEqual(json_utils.loads(cohort.to_json()), cohort.to_design_dict())
+
+    @skipIf(json_utils.orjson is None, "orjson is not installed")
+    def test_orjson_and_stdlib_output_match(self):
+        """Test that the export text does not depend on whether orjson is installed."""
+        data = {"name": "Désencombrement numérique", "surveys": [{"slug": "daily", "questions": []}]}
+
+        for indent in (None, 0, 2):
+            with self.subTest(indent=indent):
+                fast = json_utils.dumps_bytes(data, indent=indent)
+                with mock.patch.object(json_utils, 'orjson', None):
+                    self.assertEqual(json_utils.dumps_bytes(data, indent=indent), fast)
+
+    def test_to_json_bytes_matches_to_json(self):
+        """Test that to_json_bytes encodes the same JSON as to_json."""
+        cohort = Cohort.from_design_dict(_minimal_design(), start_date=date(2025, 1, 1))
+
+        self.assertEqual(cohort.to_json_bytes(), cohort.to_json().encode())
+
+
+class CohortDesignValidationTests(TestCase):
+    """Tests for Cohort.validate_design_dict."""
+
+    def test_valid_design_has_no_errors(self):
+        """Test that a valid design produces no errors."""
+        self.assertEqual(Cohort.validate_design_dict(_minimal_design()), [])
+
+    def test_missing_top_level_keys(self):
+        """Test that missing top-level keys are reported."""
+        errors = Cohort.validate_design_dict({})
+
+        self.assertIn("Missing 'cohort_template' key", errors)
+        self.assertIn("Missing 'surveys' key", errors)
+
+    def test_invalid_question_type_and_schedule(self):
+        """Test that nested errors are reported with their path."""
+        data = _minimal_design()
+        data["surveys"][0]["questions"][0]["type"] = "slider"
+        del data["surveys"][1]["schedule"]["day_of_week"]
+
+        errors = Cohort.validate_design_dict(data)
+
+        self.assertEqual(errors, [
+            "surveys[0].questions[0]: invalid type 'slider'",
+            "surveys[1].schedule: WEEKLY frequency requires 'day_of_week'",
+        ])
+
+    def test_non_string_type_and_frequency_are_reported(self):
+        """Test that list/dict values are reported as invalid instead of raising TypeError."""
+        data = _minimal_design()
+        data["surveys"][0]["questions"][0]["type"] = ["integer"]
+        data["surveys"][1]["schedule"]["frequency"] = {}
+
+        self.assertEqual(Cohort.validate_design_dict(data), [
+            "surveys[0].questions[0]: invalid type '['integer']'",
+            "surveys[1].schedule: invalid frequency '{}'",
+        ])
+
+    def test_iter_design_errors_is_lazy(self):
+        """Test that the error generator can be stopped after the first error."""
+        errors = Cohort.iter_design_errors({})
+
+        self.assertEqual(next(errors), "Missing 'cohort_template' key")
+
+    def test_invalid_offset_from(self):
+        """Test that a ONCE schedule with an unknown offset_from is reported."""
+        data = _minimal_design()
+        data["surveys"][0]["schedule"] = {"frequency": "ONCE", "offset_days": 0, "offset_from": "middle"}
+
+        self.assertEqual(
+            Cohort.validate_design_dict(data),
+            ["surveys[0].schedule: invalid offset_from 'middle'"],
+        )
+
+    def test_non_string_offset_from_is_reported(self):
+        """Test that a list offset_from is reported as invalid instead of raising TypeError."""
+        data = _minimal_design()
+        data["surveys"][0]["schedule"] = {"frequency": "ONCE", "offset_days": 0, "offset_from": ["COHORT_START"]}
+
+        self.assertEqual(
+            Cohort.validate_design_dict(data),
+            ["surveys[0].schedule: invalid offset_from '['COHORT_START']'"],
+        )
@@ -7,17 +7,25 @@ Tests cover:
 - EmailSendLog creation
 - Error handling
 """
-from datetime import date, timedelta
-from django.test import TestCase
+from datetime import date, datetime, timedelta
+import threading
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, TransactionTestCase
 from django.contrib.auth import get_user_model
 from django.core import mail
 from unittest.mock import patch, MagicMock
+import pytz
 
 from accounts.models import UserProfile
-from cohorts.models import Cohort, Enrollment, EmailSendLog
+from cohorts.models import Cohort, Enrollment, EmailSendLog, TaskScheduler
+from surveys.models import Survey
+from cohorts.management.commands import send_task_reminders
 from cohorts.email_reminders import (
     send_task_reminder_to_user,
     send_task_reminders_for_timezone,
+    get_timezones_before_reminder_hour,
     _build_idempotency_key,
 )
 
@@ -68,23 +76,39 @@ class EmailSendLogModelTests(TestCase):
         """Test that was_sent returns False when key doesn't exist."""
         self.assertFalse(EmailSendLog.objects.was_sent('nonexistent_key'))
 
-    def test_idempotency_key_unique_constraint(self):
-        """Test that duplicate idempotency keys raise an error."""
+    def test_sent_keys_returns_only_sent_keys(self):
+        """Test that sent_keys filters a batch of keys in one query."""
+        EmailSendLog.objects.record_sent(
+            idempotency_key='sent_key:1',
+            recipient_email='test@example.com',
+            email_type='task_reminder',
+        )
+
+        with self.assertNumQueries(1):
+            sent = EmailSendLog.objects.sent_keys(['sent_key:1', 'unsent_key:2'])
+
+        self.assertEqual(sent, {'sent_key:1'})
+
+    def test_idempotency_key_recorded_once(self):
+        """Test that recording a duplicate idempotency key returns the existing log."""
         idempotency_key = 'duplicate_key:789'
 
-        EmailSendLog.objects.record_sent(
+        first = EmailSendLog.objects.record_sent(
             idempotency_key=idempotency_key,
             recipient_email='test@example.com',
             email_type='task_reminder',
         )
 
-        with self.assertRaises(Exception):  # IntegrityError
-            EmailSendLog.objects.record_sent(
+        with self.assertLogs('cohorts.models', level='WARNING'):
+            second = EmailSendLog.objects.record_sent(
                 idempotency_key=idempotency_key,
                 recipient_email='test@example.com',
                 email_type='task_reminder',
             )
 
+        self.assertEqual(second.pk, first.pk)
+        self.assertEqual(EmailSendLog.objects.filter(idempotency_key=idempotency_key).count(), 1)
+
 
 class BuildIdempotencyKeyTests(TestCase):
     """Tests for _build_idempotency_key helper function."""
@@ -119,6 +143,18 @@ class BuildIdempotencyKeyTests(TestCase):
         self.assertNotEqual(key1, key2)
 
 
+class GetTimezonesBeforeReminderHourTests(TestCase):
+    """Tests for the pure-Python timezone pre-filter."""
+
+    def test_returns_only_timezones_before_10am(self):
+        """Test that only timezones where it's not yet 10am are returned."""
+        now = datetime(2024, 1, 15, 12, 0, tzinfo=pytz.utc)  # 07:00 in New York, 21:00 in Tokyo
+
+        skipped = get_timezones_before_reminder_hour(['America/New_York', 'Asia/Tokyo', 'UTC'], now=now)
+
+        self.assertEqual(skipped, ['America/New_York'])
+
+
 class EmailReminderIdempotencyTests(TestCase):
     """Tests for email reminder idempotency."""
 
@@ -208,6 +244,18 @@ class EmailReminderIdempotencyTests(TestCase):
         # and now we have 2 log entries
         self.assertEqual(EmailSendLog.objects.count(), 2)
 
+    def test_prefetched_sent_keys_skip_user(self):
+        """Test that a key in the pre-fetched sent set skips the user without a lookup."""
+        mail.outbox = []
+        today = date.today()
+        sent_keys = {_build_idempotency_key(self.user.id, today)}
+
+        with self.assertNumQueries(0):
+            result = send_task_reminder_to_user(self.user, today=today, sent_keys=sent_keys)
+
+        self.assertFalse(result)
+        self.assertEqual(len(mail.outbox), 0)
+
 
 class EmailReminderDryRunTests(TestCase):
     """Tests for dry-run mode."""
@@ -379,3 +427,85 @@ class SendTaskRemindersForTimezoneTests(TestCase):
 
         self.assertEqual(result, 0)
 
+
+class _FixedNoon(datetime):
+    """datetime whose now() is always 2024-01-15 12:00 UTC (07:00 in New York, 21:00 in Tokyo)."""
+
+    @classmethod
+    def now(cls, tz=None):
+        noon = datetime(2024, 1, 15, 12, 0, tzinfo=pytz.utc)
+        return noon.astimezone(tz) if tz else noon
+
+
+class SendTaskRemindersCommandTests(TransactionTestCase):
+    """Tests for the send_task_reminders command.
+
+    With --workers above 1, worker threads use their own DB connections, so the
+    test data has to be committed.
+    """
+
+    def setUp(self):
+        """Set up one reminder-enabled user per timezone, all with a daily task due on the fixed date."""
+        cohort = Cohort.objects.create(
+            name='Test Cohort',
+            start_date=date(2024, 1, 10),
+            end_date=date(2024, 2, 9),
+            is_active=True,
+            is_paid=False,
+        )
+        survey = Survey.objects.create(slug='daily-check-in', name='Daily Check-in')
+        TaskScheduler.objects.create(survey=survey, cohort=cohort, frequency=TaskScheduler.Frequency.DAILY)
+
+        for username, timezone_name in [
+            ('london', 'Europe/London'),
+            ('tokyo', 'Asia/Tokyo'),
+            ('newyork', 'America/New_York'),
+        ]:
+            user = User.objects.create_user(username=username, email=f'{username}@example.com')
+            UserProfile.objects.filter(user=user).update(timezone=timezone_name, email_daily_reminder=True)
+            Enrollment.objects.create(user=user, cohort=cohort, status='free')
+
+    def _sent_to(self):
+        """Sorted recipient addresses of every email sent so far."""
+        return sorted(recipient for message in mail.outbox for recipient in message.to)
+
+    @patch('cohorts.email_reminders.datetime', _FixedNoon)
+    def test_sends_per_timezone_and_skips_before_reminder_hour(self):
+        """Test that timezones past 10am get reminders and earlier ones are skipped."""
+        mail.outbox = []
+        out = StringIO()
+
+        call_command('send_task_reminders', stdout=out)
+
+        self.assertEqual(self._sent_to(), ['london@example.com', 'tokyo@example.com'])
+        self.assertEqual(EmailSendLog.objects.count(), 2)
+        output = out.getvalue()
+        # The timezone count is reported before any timezone is processed
+        self.assertLess(
+            output.index("Found 2 unique timezones to process"),
+            output.index("Sent 1 email(s) for timezone"),
+        )
+
+    @patch('cohorts.email_reminders.datetime', _FixedNoon)
+    def test_thread_pool_sends_per_timezone(self):
+        """Test that --workers above 1 sends the same reminders from a thread pool."""
+        mail.outbox = []
+        # The in-memory SQLite test DB fails concurrent writes with "table is locked"
+        # instead of waiting, so let one worker touch the DB at a time.
+        db_lock = threading.Lock()
+        send_for_timezone = send_task_reminders._send_for_timezone
+
+        def locked_send_for_timezone(*args):
+            with db_lock:
+                return send_for_timezone(*args)
+
+        with patch.object(send_task_reminders, '_send_for_timezone', locked_send_for_timezone):
+            call_command('send_task_reminders', workers=2, stdout=StringIO())
+
+        self.assertEqual(self._sent_to(), ['london@example.com', 'tokyo@example.com'])
+        self.assertEqual(EmailSendLog.objects.count(), 2)
+
+    def test_workers_below_one_is_rejected(self):
+        """Test that --workers must be a positive number."""
+        with self.assertRaises(CommandError):
+            call_command('send_task_reminders', workers=0, stdout=StringIO())
@@ -149,6 +149,33 @@ class OnboardingFlowTests(TestCase):
             ).exists()
         )
 
+    def test_entry_survey_completion_stores_answers(self):
+        """Test that every answered question is saved with the submission."""
+        user = User.objects.create_user(username='testuser', email='test@example.com')
+        self.client.force_login(user)
+        Enrollment.objects.create(user=user, cohort=self.cohort, status='pending')
+
+        survey_url = reverse('cohorts:onboarding_entry_survey', kwargs={
+            'cohort_id': self.cohort.id,
+            'survey_slug': self.entry_survey.slug,
+            'due_date': self.cohort.start_date.isoformat()
+        })
+        self.client.post(survey_url, {
+            'mood_1to5': '4',
+            'baseline_screentime_min': '180',
+            'intention_text': 'I want to reduce my screen time',
+        })
+
+        submission = SurveySubmission.objects.get(user_responses__user=user)
+        self.assertEqual(
+            dict(submission.answers.values_list('question__key', 'value')),
+            {
+                'mood_1to5': '4',
+                'baseline_screentime_min': '180',
+                'intention_text': 'I want to reduce my screen time',
+            },
+        )
+
     def test_join_entry_survey_skips_if_already_completed(self):
         """Test that users who already completed entry survey skip to checkout."""
         user = User.objects.create_user(
@@ -378,3 +405,75 @@ class OnboardingFlowTests(TestCase):
         self.assertEqual(enrollment.status, 'paid')
         self.assertEqual(enrollment.amount_paid_cents, 0)
 
+
+
+class GetJoinableTests(TestCase):
+    """Tests for CohortManager.get_joinable."""
+
+    def setUp(self):
+        """Set up a cohort with two seats."""
+        self.cohort = Cohort.objects.create(
+            name='Small Cohort',
+            start_date=date.today() + timedelta(days=7),
+            end_date=date.today() + timedelta(days=37),
+            max_seats=2,
+        )
+        self.users = [
+            User.objects.create_user(username=f'user{i}', email=f'user{i}@example.com', password='pw')
+            for i in range(2)
+        ]
+
+    def test_pending_enrollments_do_not_fill_seats(self):
+        """Test that only paid/free enrollments count against max_seats."""
+        for user in self.users:
+            Enrollment.objects.create(user=user, cohort=self.cohort, status='pending')
+
+        with self.assertNumQueries(1):
+            joinable = list(Cohort.objects.get_joinable())
+
+        self.assertEqual(joinable, [self.cohort])
+        self.assertEqual(joinable[0].active_enrollment_count, 0)
+
+    def test_full_cohort_is_excluded(self):
+        """Test that a cohort at capacity is not joinable."""
+        for user in self.users:
+            Enrollment.objects.create(user=user, cohort=self.cohort, status='free')
+
+        self.assertFalse(Cohort.objects.get_joinable().exists())
+
+    def test_seats_available_uses_annotated_count(self):
+        """Test that seats_available on a joinable cohort needs no extra query."""
+        Enrollment.objects.create(user=self.users[0], cohort=self.cohort, status='paid')
+        cohort = Cohort.objects.get_joinable().get()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(cohort.seats_available(), 1)
+            self.assertFalse(cohort.is_full())
+
+    def test_is_full_without_annotation(self):
+        """Test that is_full counts only active enrollments up to max_seats."""
+        Enrollment.objects.create(user=self.users[0], cohort=self.cohort, status='paid')
+        Enrollment.objects.create(user=self.users[1], cohort=self.cohort, status='pending')
+        self.assertFalse(Cohort.objects.get(pk=self.cohort.pk).is_full())
+
+        Enrollment.objects.filter(user=self.users[1]).update(status='free')
+        self.assertTrue(Cohort.objects.get(pk=self.cohort.pk).is_full())
+
+    def test_enrollment_period_uses_given_date(self):
+        """Test that get_joinable checks the enrollment period against the given date."""
+        self.cohort.enrollment_start_date = date(2025, 1, 1)
+        self.cohort.enrollment_end_date = date(2025, 1, 10)
+        self.cohort.save()
+
+        self.assertTrue(Cohort.objects.get_joinable(today=date(2025, 1, 5)).exists())
+        self.assertFalse(Cohort.objects.get_joinable(today=date(2025, 1, 11)).exists())
+
+    def test_with_seat_stats_annotates_any_queryset(self):
+        """Test that with_seat_stats feeds active_enrollments without extra queries."""
+        Enrollment.objects.create(user=self.users[0], cohort=self.cohort, status='free')
+        Enrollment.objects.create(user=self.users[1], cohort=self.cohort, status='pending')
+        cohort = Cohort.objects.filter(pk=self.cohort.pk).with_seat_stats().get()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(cohort.active_enrollments(), 1)
+            self.assertEqual(cohort.seats_available(), 1)
@@ -1,9 +1,21 @@
 import pytz
 from django.contrib.auth.models import AbstractUser
-from datetime import date
+from datetime import date, tzinfo
+from functools import lru_cache
 from django.utils import timezone
 from accounts.models import UserProfile
 
+
+@lru_cache(maxsize=None)
+def get_timezone(timezone_name: str) -> tzinfo:
+    """
+    Return the tzinfo for a timezone name, memoized per process.
+
+    Raises:
+        pytz.exceptions.UnknownTimeZoneError: If the name is not a known timezone
+    """
+    return pytz.timezone(timezone_name)
+
 def get_user_today(user: AbstractUser) -> date:
     """
     Get today's date in user's timezone.
@@ -17,6 +29,6 @@ def get_user_today(user: AbstractUser) -> date:
     
     # Get or create profile (defensive programming)
     profile, _ = UserProfile.objects.get_or_create(user=user)
-    user_tz = pytz.timezone(profile.timezone)
+    user_tz = get_timezone(profile.timezone)
     return timezone.now().astimezone(user_tz).date()
 
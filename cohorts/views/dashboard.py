@@ -12,7 +12,7 @@ logger = logging.getLogger(__name__)
 def dashboard(request: HttpRequest) -> HttpResponse:
     """Homepage showing today's tasks for logged-in users or enrollment landing for logged-out."""
     # Get next active cohort for enrollment landing
-    next_cohort = next(iter(Cohort.objects.get_joinable()), None)
+    next_cohort = Cohort.objects.get_joinable().first()
 
     # Get user's most recent enrollment (assuming one active cohort at a time)
     # Also fetch the total number of enrollments for the cohort in the same query.
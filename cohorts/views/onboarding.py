@@ -4,7 +4,7 @@ from django.http import HttpRequest, HttpResponse
 from django.conf import settings
 from django.urls import reverse
 
-from ..models import Cohort, Enrollment, UserSurveyResponse
+from ..models import ACTIVE_ENROLLMENT_STATUSES, Cohort, Enrollment, UserSurveyResponse
 from ..forms import PaymentAmountForm
 from ..decorators import enrollment_required
 
@@ -17,10 +17,8 @@ logger = logging.getLogger(__name__)
 @login_required
 def cohort_join(request: HttpRequest, cohort_id: int) -> HttpResponse:
     """Join a cohort (with or without payment)."""
-    # Find the specific cohort from the list of joinable cohorts.
-    # This is more efficient as it reuses the manager's logic.
-    joinable_cohorts = Cohort.objects.get_joinable()
-    cohort = next((c for c in joinable_cohorts if c.id == cohort_id), None)
+    # Find the specific cohort among the joinable cohorts, reusing the manager's logic.
+    cohort = Cohort.objects.get_joinable().filter(pk=cohort_id).first()
 
     if not cohort:
         # If not found, fetch it to provide a specific error message.
@@ -62,7 +60,7 @@ def join_entry_survey(request: HttpRequest) -> HttpResponse:
     """Step 2: Entry survey before checkout."""
 
     # Find the next upcoming or recently started cohort
-    cohort = next(iter(Cohort.objects.get_joinable()), None)
+    cohort = Cohort.objects.get_joinable().first()
 
     if not cohort:
         return render(request, 'cohorts/join_error.html', {
@@ -115,7 +113,7 @@ def join_checkout(request: HttpRequest) -> HttpResponse:
     """Step 3: Payment checkout (or skip if free cohort)."""
 
     # Find the next upcoming or recently started cohort
-    cohort = next(iter(Cohort.objects.get_joinable()), None)
+    cohort = Cohort.objects.get_joinable().first()
 
     if not cohort:
         return render(request, 'cohorts/join_error.html', {
@@ -135,7 +133,7 @@ def join_checkout(request: HttpRequest) -> HttpResponse:
         cohort=cohort
     ).first()
 
-    if existing_enrollment and existing_enrollment.status in ['paid', 'free']:
+    if existing_enrollment and existing_enrollment.status in ACTIVE_ENROLLMENT_STATUSES:
         return redirect('cohorts:dashboard')
 
     # If free cohort, create enrollment and redirect to success
@@ -7,9 +7,10 @@ from typing import Any, Dict
 from datetime import date
 from django.views.generic.edit import FormView
 from django.views.generic.list import ListView
+from django.db.models import Prefetch
 
 from surveys.forms import DynamicSurveyForm
-from surveys.models import Survey
+from surveys.models import Answer, Survey
 
 from cohorts.models import Cohort, Enrollment, UserSurveyResponse
 from cohorts.surveys import create_survey_submission
@@ -175,7 +176,10 @@ class PastSubmissionsListView(ListView):
             user=self.request.user,
             cohort=self.cohort,
             submission__survey=self.survey,
-        ).select_related('submission').prefetch_related('submission__answers', 'submission__answers__question').order_by('-submission__completed_at')
+        ).select_related('submission').prefetch_related(
+            # Load each answer with its question in one query, instead of one per relation.
+            Prefetch('submission__answers', queryset=Answer.objects.select_related('question')),
+        ).order_by('-submission__completed_at')
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         """Add dynamic page title, empty message, and summary template names."""
@@ -6,7 +6,7 @@ from django.views.decorators.csrf import csrf_exempt
 from django.http import HttpResponse, HttpRequest
 from django.conf import settings
 from django.contrib import messages
-from cohorts.models import Cohort, Enrollment
+from cohorts.models import ACTIVE_ENROLLMENT_STATUSES, Cohort, Enrollment
 import stripe
 import logging
 
@@ -25,7 +25,7 @@ def create_checkout_session(request: HttpRequest, cohort_id: int) -> HttpRespons
     
     # Check if already paid
     enrollment = Enrollment.objects.filter(user=request.user, cohort=cohort).first()
-    if enrollment and enrollment.status in ['paid', 'free']:
+    if enrollment and enrollment.status in ACTIVE_ENROLLMENT_STATUSES:
         messages.info(request, 'You have already enrolled in this cohort.')
         return redirect('cohorts:dashboard')
     
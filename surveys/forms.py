@@ -19,8 +19,10 @@ class DynamicSurveyForm(forms.Form):
         # Store section info and info questions for rendering
         self._field_sections = {}
         self._info_questions = {}  # Store INFO type questions by key
+        # Loaded once (in 'order', per Question.Meta) and reused by rendering and saving
+        self.questions = list(self.survey.questions.all())
 
-        for question in self.survey.questions.all():
+        for question in self.questions:
             field_key = question.key
             
             # Skip INFO type - these are display-only, no form field needed
@@ -55,7 +57,7 @@ class DynamicSurveyForm(forms.Form):
         current_items = []
         
         # Process all questions in order (including INFO types)
-        for question in self.survey.questions.all().order_by('order'):
+        for question in self.questions:
             section = self._field_sections.get(question.key, "")
             
             if section != current_section:
@@ -33,8 +33,10 @@ class Survey(models.Model):
             "title_template": self.title_template,
         }
         if include_questions:
+            # Question.Meta.ordering already sorts by order; an explicit
+            # order_by() here would bypass any prefetched questions.
             data["questions"] = [
-                q.to_design_dict() for q in self.questions.all().order_by('order')
+                q.to_design_dict() for q in self.questions.all()
             ]
         return data
 
@@ -57,10 +59,10 @@ class Survey(models.Model):
         
         if save:
             survey.save()
-            # Import here to avoid circular import at module level
-            from surveys.models import Question
-            for i, q_data in enumerate(data.get("questions", [])):
-                Question.from_design_dict(survey, q_data, order=i).save()
+            Question.objects.bulk_create([
+                Question.from_design_dict(survey, q_data, order=i)
+                for i, q_data in enumerate(data.get("questions", []))
+            ])
         else:
             # Store for later creation
             survey._pending_questions = data.get("questions", [])
@@ -71,8 +73,10 @@ class Survey(models.Model):
         """Create questions from _pending_questions if they exist."""
         pending = getattr(self, '_pending_questions', None)
         if pending:
-            for i, q_data in enumerate(pending):
-                Question.from_design_dict(self, q_data, order=i).save()
+            Question.objects.bulk_create([
+                Question.from_design_dict(self, q_data, order=i)
+                for i, q_data in enumerate(pending)
+            ])
             self._pending_questions = None
 
 